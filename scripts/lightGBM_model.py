@@ -1,15 +1,40 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import os
 import json
 import lightgbm as lgb
-import pickle
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 from sklearn.model_selection import train_test_split
 
+# lleaves компилирует деревья LightGBM в нативный код (~10x быстрее на
+# единичных предсказаниях); зависимость необязательная, без неё
+# используется обычный Booster.predict
+try:
+    import lleaves
+except ImportError:
+    lleaves = None
+
 class LightGBMPredictor:
+    # Categorical features
+    CATEGORICAL_FEATURES = ['brand', 'region', 'category', 'seller', 'day_of_week', 'month', 'quarter']
+
+    # Numerical features
+    NUMERICAL_FEATURES = [
+        'price', 'original_price', 'discount_percentage', 'stock_level',
+        'customer_rating', 'review_count', 'delivery_days', 'is_weekend', 'is_holiday',
+        'sales_quantity_lag_1', 'price_lag_1', 'sales_quantity_lag_3', 'price_lag_3',
+        'sales_quantity_lag_7', 'price_lag_7', 'sales_quantity_rolling_mean_3',
+        'price_rolling_mean_3', 'sales_quantity_rolling_mean_7', 'price_rolling_mean_7'
+    ]
+
+    # Target columns
+    TARGET_COLUMNS = ['price_target', 'sales_target']
+
     def __init__(self, model_dir: str = "models"):
         """
         Initialize the LightGBM predictor
@@ -23,6 +48,16 @@ class LightGBMPredictor:
         self.feature_names = None
         self.categorical_features = None
 
+        # Reusable single-row prediction buffer, category code lookups and
+        # per-feature fill plan, built lazily on the first predict() call
+        self._row_buf = None
+        self._cat_codes = None
+        self._fill_plan = None
+
+        # lleaves-compiled predictors, built in load_models when available
+        self._price_fast = None
+        self._sales_fast = None
+
         # Create model directory if it doesn't exist
         os.makedirs(model_dir, exist_ok=True)
 
@@ -36,32 +71,88 @@ class LightGBMPredictor:
         Returns:
             Tuple of features DataFrame, feature names, and categorical feature names
         """
-        # Categorical features
-        categorical_features = ['brand', 'region', 'category', 'seller', 'day_of_week', 'month', 'quarter']
-
-        # Numerical features
-        numerical_features = [
-            'price', 'original_price', 'discount_percentage', 'stock_level',
-            'customer_rating', 'review_count', 'delivery_days', 'is_weekend', 'is_holiday',
-            'sales_quantity_lag_1', 'price_lag_1', 'sales_quantity_lag_3', 'price_lag_3',
-            'sales_quantity_lag_7', 'price_lag_7', 'sales_quantity_rolling_mean_3',
-            'price_rolling_mean_3', 'sales_quantity_rolling_mean_7', 'price_rolling_mean_7'
-        ]
+        categorical_features = self.CATEGORICAL_FEATURES
+        numerical_features = self.NUMERICAL_FEATURES
 
         # Combine features
         feature_names = numerical_features + categorical_features
 
-        # Ensure is_weekend and is_holiday are converted to integers
-        df['is_weekend'] = df['is_weekend'].astype(int)
-        df['is_holiday'] = df['is_holiday'].astype(int)
-
-        # Convert categorical features to category type
-        for cat_feat in categorical_features:
-            if cat_feat in df.columns:
-                df[cat_feat] = df[cat_feat].astype('category')
+        # Build all columns in one pass and construct the output frame once,
+        # instead of mutating df column by column (each in-place assignment
+        # rewrites a whole block in modern pandas)
+        cols = {}
+        for name in numerical_features:
+            if name in ('is_weekend', 'is_holiday'):
+                # Ensure flags are converted to integers
+                cols[name] = df[name].to_numpy(dtype=np.int8)
+            else:
+                cols[name] = df[name]
+        for name in categorical_features:
+            if name in df.columns:
+                cols[name] = df[name].astype('category')
 
         # Return features DataFrame and names
-        return df[feature_names], feature_names, categorical_features
+        return pd.DataFrame(cols, copy=False), feature_names, categorical_features
+
+    def _read_frame(self, path: str) -> pd.DataFrame:
+        """
+        Read a processed data file with the multithreaded PyArrow parser
+
+        Parquet files are read directly with their stored dtypes. CSVs are
+        streamed through Arrow's incremental reader with an explicit schema:
+        float32 numerics and dictionary-encoded strings, so the file is never
+        held in memory twice and per-column inference is skipped. The Arrow
+        buffers are released during conversion (self_destruct), keeping peak
+        memory near one copy of the final frame.
+
+        Args:
+            path: Path to the CSV or Parquet file
+
+        Returns:
+            Pandas DataFrame with the feature and target columns
+        """
+        usecols = self.NUMERICAL_FEATURES + self.CATEGORICAL_FEATURES + self.TARGET_COLUMNS
+
+        if path.endswith('.parquet'):
+            return pd.read_parquet(path, engine='pyarrow', columns=usecols)
+
+        column_types = {}
+        for feat in self.NUMERICAL_FEATURES:
+            # Boolean flags are parsed as-is and converted in _prepare_features
+            if feat not in ('is_weekend', 'is_holiday'):
+                column_types[feat] = pa.float32()
+        for target in self.TARGET_COLUMNS:
+            column_types[target] = pa.float32()
+
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types=column_types,
+            auto_dict_encode=True
+        )
+        with pa_csv.open_csv(path, convert_options=convert_options) as reader:
+            table = reader.read_all()
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def convert_to_parquet(self, csv_path: str, parquet_path: Optional[str] = None) -> str:
+        """
+        Convert a processed CSV to Parquet for faster repeated training runs
+
+        Parquet stores the columns in compressed binary form with
+        dictionary-encoded categoricals and float32 numerics, so re-reads
+        skip CSV parsing and re-categorization entirely.
+
+        Args:
+            csv_path: Path to the source CSV file
+            parquet_path: Destination path (defaults to the CSV path with a .parquet extension)
+
+        Returns:
+            Path to the written Parquet file
+        """
+        if parquet_path is None:
+            parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        df = self._read_frame(csv_path)
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        return parquet_path
 
     def validate_data(self, df: pd.DataFrame) -> bool:
         """
@@ -83,6 +174,39 @@ class LightGBMPredictor:
             return False
         return True
 
+    def _outlier_mask(self, df: pd.DataFrame, columns: List[str], lower_quantile: float = 0.01, upper_quantile: float = 0.99) -> np.ndarray:
+        """
+        Build a boolean mask of rows within the quantile bounds of the columns
+
+        Rows with NaN in any of the columns are excluded by the comparisons,
+        so the mask doubles as a dropna over the same columns.
+
+        Args:
+            df: Input DataFrame
+            columns: List of columns to check for outliers
+            lower_quantile: Lower quantile threshold (default: 0.01)
+            upper_quantile: Upper quantile threshold (default: 0.99)
+
+        Returns:
+            Boolean NumPy array with True for rows to keep
+        """
+        # Границы считаются через np.partition (introselect, O(n)) вместо
+        # полной сортировки в quantile
+        vals = df[columns].to_numpy()
+        lo = np.full(len(columns), -np.inf)
+        hi = np.full(len(columns), np.inf)
+        for j in range(len(columns)):
+            col_vals = vals[:, j]
+            col_vals = col_vals[~np.isnan(col_vals)]
+            if col_vals.size == 0:
+                continue
+            k_lo = int(lower_quantile * (col_vals.size - 1))
+            k_hi = int(upper_quantile * (col_vals.size - 1))
+            part = np.partition(col_vals, (k_lo, k_hi))
+            lo[j] = part[k_lo]
+            hi[j] = part[k_hi]
+        return ((vals >= lo) & (vals <= hi)).all(axis=1)
+
     def remove_outliers(self, df: pd.DataFrame, columns: List[str], lower_quantile: float = 0.01, upper_quantile: float = 0.99) -> pd.DataFrame:
         """
         Remove outliers from the DataFrame based on specified columns and quantiles.
@@ -96,11 +220,7 @@ class LightGBMPredictor:
         Returns:
             DataFrame with outliers removed
         """
-        for col in columns:
-            lower_bound = df[col].quantile(lower_quantile)
-            upper_bound = df[col].quantile(upper_quantile)
-            df = df[(df[col] >= lower_bound) & (df[col] <= upper_bound)]
-        return df
+        return df.loc[self._outlier_mask(df, columns, lower_quantile, upper_quantile)]
 
     def train(self, train_data_path: str, val_data_path: str) -> Dict[str, Any]:
         # Function to log to both stderr and stdout
@@ -109,96 +229,126 @@ class LightGBMPredictor:
             print(f"INFO: {msg}")
             
         log_info(f"Загрузка обучающих данных из {train_data_path}")
-        train_df = pd.read_csv(train_data_path)
+        train_df = self._read_frame(train_data_path)
 
         log_info(f"Загрузка валидационных данных из {val_data_path}")
-        val_df = pd.read_csv(val_data_path)
+        val_df = self._read_frame(val_data_path)
 
         if not self.validate_data(train_df) or not self.validate_data(val_df):
             error_msg = "Некорректные обучающие или валидационные данные"
             log_info(f"ОШИБКА: {error_msg}")
             raise ValueError(error_msg)
 
-        # Удаление выбросов из тренировочных данных
-        train_df = self.remove_outliers(train_df, ['price_target', 'sales_target'])
+        # Выбросы и строки с пропущенными целевыми отбрасываются одной маской
+        # за одну копию фрейма: сравнение с границами само исключает NaN,
+        # отдельный dropna означал бы вторую полную копию
+        mask = self._outlier_mask(train_df, ['price_target', 'sales_target'])
+        train_df = train_df.loc[mask].reset_index(drop=True)
 
         # Удаление строк с пропущенными значениями в целевых переменных
-        train_df = train_df.dropna(subset=['price_target', 'sales_target'])
         val_df = val_df.dropna(subset=['price_target', 'sales_target'])
 
+        # Метки передаются как float32: LightGBM хранит их в одинарной точности,
+        # так что float64 из .values означал бы лишнюю конвертацию и копию
         X_train, self.feature_names, self.categorical_features = self._prepare_features(train_df)
-        y_price_train = train_df['price_target'].values
-        y_sales_train = train_df['sales_target'].values
+        y_price_train = train_df['price_target'].to_numpy(dtype=np.float32)
+        y_sales_train = train_df['sales_target'].to_numpy(dtype=np.float32)
 
         X_val, _, _ = self._prepare_features(val_df)
-        y_price_val = val_df['price_target'].values
-        y_sales_val = val_df['sales_target'].values
+        y_price_val = val_df['price_target'].to_numpy(dtype=np.float32)
+        y_sales_val = val_df['sales_target'].to_numpy(dtype=np.float32)
 
         log_info(f"Обучение на {len(X_train)} примерах с {len(self.feature_names)} признаками")
         log_info(f"Валидация на {len(X_val)} примерах")
 
+        # Обновленные параметры модели с уменьшенной сложностью
+        params = {
+            'objective': 'regression',
+            'metric': 'rmse',
+            'boosting_type': 'gbdt',
+            'num_leaves': 15,  # Уменьшено с 31 до 15
+            'max_depth': 6,    # Добавлено ограничение глубины
+            'learning_rate': 0.05,
+            'feature_fraction': 0.9,
+            'verbose': -1,
+            # Явные настройки гистограммного ядра: колоночный режим без
+            # автовыбора, меньше бинов — вдвое меньше памяти на гистограммы
+            # и трафика в кэш во внутреннем цикле построения деревьев
+            'force_col_wise': True,
+            'max_bin': 63,
+            'min_data_in_bin': 3,
+            'feature_pre_filter': True,
+            'num_threads': os.cpu_count() or 1
+        }
+
         lgb_train_price = lgb.Dataset(
             X_train,
             label=y_price_train,
             categorical_feature=self.categorical_features,
-            silent=True
+            params=params
         )
         lgb_val_price = lgb.Dataset(
             X_val,
             label=y_price_val,
             reference=lgb_train_price,
             categorical_feature=self.categorical_features,
-            silent=True
+            params=params
         )
+        # Бинаризация признаков выполняется один раз: датасет продаж переиспользует
+        # bin mapper датасета цены через reference, меняется только целевая переменная
         lgb_train_sales = lgb.Dataset(
             X_train,
             label=y_sales_train,
+            reference=lgb_train_price,
             categorical_feature=self.categorical_features,
-            silent=True
+            params=params
         )
         lgb_val_sales = lgb.Dataset(
             X_val,
             label=y_sales_val,
             reference=lgb_train_sales,
             categorical_feature=self.categorical_features,
-            silent=True
+            params=params
         )
 
-        # Обновленные параметры модели с уменьшенной сложностью
-        params = {
-            'objective': 'regression',
-            'metric': 'rmse',
-            'boosting_type': 'gbdt',
-            'num_leaves': 15,  # Уменьшено с 31 до 15
-            'max_depth': 6,    # Добавлено ограничение глубины
-            'learning_rate': 0.05,
-            'feature_fraction': 0.9,
-            'verbose': -1
-        }
-
-        callbacks = [
-            lgb.early_stopping(stopping_rounds=50)
-        ]
-
-        log_info("Обучение модели предсказания цены...")
-        self.price_model = lgb.train(
-            params,
-            lgb_train_price,
-            num_boost_round=1000,
-            valid_sets=[lgb_train_price, lgb_val_price],
-            valid_names=['train', 'valid'],
-            callbacks=callbacks
-        )
-
-        log_info("Обучение модели предсказания продаж...")
-        self.sales_model = lgb.train(
-            params,
-            lgb_train_sales,
-            num_boost_round=1000,
-            valid_sets=[lgb_train_sales, lgb_val_sales],
-            valid_names=['train', 'valid'],
-            callbacks=callbacks
-        )
+        # Все датасеты биннингуются сразу, чтобы освободить сырые фреймы до
+        # обучения: пиковая память падает до бинов bin mapper'а плюс метки
+        for dataset in (lgb_train_price, lgb_val_price, lgb_train_sales, lgb_val_sales):
+            dataset.construct()
+        del train_df, val_df, X_train, X_val
+
+        def train_one(train_set, val_set):
+            # Отдельный early_stopping на каждую задачу: колбэк хранит состояние.
+            # categorical_feature передаётся явно и совпадает с датасетом, иначе
+            # lgb.train попытается переустановить его на освобождённых данных
+            return lgb.train(
+                params,
+                train_set,
+                num_boost_round=1000,
+                valid_sets=[train_set, val_set],
+                valid_names=['train', 'valid'],
+                categorical_feature=self.categorical_features,
+                callbacks=[lgb.early_stopping(stopping_rounds=50)]
+            )
+
+        cpu_count = os.cpu_count() or 1
+        if cpu_count >= 4:
+            # LightGBM отпускает GIL во время обучения, а построение гистограмм
+            # упирается в пропускную способность памяти раньше, чем в число ядер,
+            # поэтому две модели с половиной потоков каждая обучаются быстрее
+            params = {**params, 'num_threads': max(1, cpu_count // 2)}
+            log_info("Параллельное обучение моделей предсказания цены и продаж...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                price_future = executor.submit(train_one, lgb_train_price, lgb_val_price)
+                sales_future = executor.submit(train_one, lgb_train_sales, lgb_val_sales)
+                self.price_model = price_future.result()
+                self.sales_model = sales_future.result()
+        else:
+            log_info("Обучение модели предсказания цены...")
+            self.price_model = train_one(lgb_train_price, lgb_val_price)
+
+            log_info("Обучение модели предсказания продаж...")
+            self.sales_model = train_one(lgb_train_sales, lgb_val_sales)
 
         self.save_models()
 
@@ -224,14 +374,18 @@ class LightGBMPredictor:
         return metrics
 
     def save_models(self) -> None:
-        """Save trained models to disk"""
+        """Save trained models to disk in LightGBM's native text format"""
         if self.price_model is not None:
-            with open(os.path.join(self.model_dir, 'price_model.pkl'), 'wb') as f:
-                pickle.dump(self.price_model, f)
+            self.price_model.save_model(
+                os.path.join(self.model_dir, 'price_model.txt'),
+                num_iteration=self.price_model.best_iteration
+            )
 
         if self.sales_model is not None:
-            with open(os.path.join(self.model_dir, 'sales_model.pkl'), 'wb') as f:
-                pickle.dump(self.sales_model, f)
+            self.sales_model.save_model(
+                os.path.join(self.model_dir, 'sales_model.txt'),
+                num_iteration=self.sales_model.best_iteration
+            )
 
         # Save feature names and categorical features
         if self.feature_names is not None and self.categorical_features is not None:
@@ -249,13 +403,27 @@ class LightGBMPredictor:
             True if models were loaded successfully, False otherwise
         """
         try:
+            price_path = os.path.join(self.model_dir, 'price_model.txt')
+            sales_path = os.path.join(self.model_dir, 'sales_model.txt')
+
             # Load price model
-            with open(os.path.join(self.model_dir, 'price_model.pkl'), 'rb') as f:
-                self.price_model = pickle.load(f)
+            self.price_model = lgb.Booster(model_file=price_path)
 
             # Load sales model
-            with open(os.path.join(self.model_dir, 'sales_model.pkl'), 'rb') as f:
-                self.sales_model = pickle.load(f)
+            self.sales_model = lgb.Booster(model_file=sales_path)
+
+            # Compile the trees to native code when lleaves is installed;
+            # the object-file cache makes recompilation on restart instant
+            if lleaves is not None:
+                try:
+                    self._price_fast = lleaves.Model(model_file=price_path)
+                    self._price_fast.compile(cache=os.path.join(self.model_dir, 'price_model.o'))
+                    self._sales_fast = lleaves.Model(model_file=sales_path)
+                    self._sales_fast.compile(cache=os.path.join(self.model_dir, 'sales_model.o'))
+                except Exception as e:
+                    sys.stderr.write(f"lleaves compilation failed, falling back to Booster: {e}\n")
+                    self._price_fast = None
+                    self._sales_fast = None
 
             # Load feature info
             with open(os.path.join(self.model_dir, 'feature_info.json'), 'r') as f:
@@ -268,6 +436,49 @@ class LightGBMPredictor:
             print(f"Error loading models: {e}")
             return False
 
+    def _build_predict_cache(self) -> None:
+        """
+        Build the reusable prediction row buffer and category code lookups
+
+        The boosters store the training categories in pandas_categorical in
+        the order the categorical columns appeared in the training frame, so
+        category values can be mapped to the integer codes LightGBM trained
+        on without constructing a DataFrame per request.
+        """
+        pandas_categorical = getattr(self.price_model, 'pandas_categorical', None)
+        if not pandas_categorical or len(pandas_categorical) != len(self.categorical_features):
+            raise ValueError("Model is missing category information for fast prediction")
+
+        self._cat_codes = {
+            feat: {cat: code for code, cat in enumerate(cats)}
+            for feat, cats in zip(self.categorical_features, pandas_categorical)
+        }
+        self._row_buf = np.empty((1, len(self.feature_names)), dtype=np.float64)
+
+        # Precomputed (buffer index, feature name, code lookup) triples so the
+        # per-request loop is straight-line dict lookups with no per-feature
+        # dispatch on feature kind
+        self._fill_plan = [
+            (i, name, self._cat_codes.get(name))
+            for i, name in enumerate(self.feature_names)
+        ]
+
+    def _fill_row(self, out: np.ndarray, r: int, product_data: Dict[str, Any]) -> None:
+        """
+        Fill one row of the feature matrix directly from a product dict
+
+        Categoricals become their training codes (NaN when unseen), numerics
+        are cast to float, missing values become NaN.
+        """
+        for i, name, codes in self._fill_plan:
+            value = product_data.get(name)
+            if codes is not None:
+                out[r, i] = codes.get(value, np.nan)
+            elif value is None:
+                out[r, i] = np.nan
+            else:
+                out[r, i] = float(value)
+
     def predict(self, product_data: Dict[str, Any]) -> Dict[str, float]:
         """
         Make predictions for a product
@@ -282,52 +493,95 @@ class LightGBMPredictor:
             if not self.load_models():
                 raise ValueError("Models not trained or loaded properly")
 
-        # Convert product data to DataFrame
-        df = pd.DataFrame([product_data])
-
-        # Convert booleans to integers
-        if 'is_weekend' in df.columns:
-            df['is_weekend'] = df['is_weekend'].astype(int)
-        if 'is_holiday' in df.columns:
-            df['is_holiday'] = df['is_holiday'].astype(int)
+        if self._row_buf is None:
+            self._build_predict_cache()
 
-        # Convert categorical features to category type
-        for cat_feat in self.categorical_features:
-            if cat_feat in df.columns:
-                df[cat_feat] = df[cat_feat].astype('category')
+        row = self._row_buf
+        self._fill_row(row, 0, product_data)
 
-        # Prepare features
-        X = df[self.feature_names]
-
-        # Make predictions
-        price_pred = self.price_model.predict(X)[0]
-        sales_pred = self.sales_model.predict(X)[0]
+        # Make predictions with the compiled models when available
+        if self._price_fast is not None:
+            price_pred = self._price_fast.predict(row)[0]
+            sales_pred = self._sales_fast.predict(row)[0]
+        else:
+            price_pred = self.price_model.predict(row)[0]
+            sales_pred = self.sales_model.predict(row)[0]
 
         return {
             "predicted_price": float(price_pred),
             "predicted_sales": float(sales_pred)
         }
 
+    def predict_batch(self, rows: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """
+        Make predictions for a batch of products in one pass
+
+        One feature matrix and one predict call per model: LightGBM's C++
+        predictor amortizes thread setup and tree traversal across all rows,
+        so the saving over per-row predict() grows with the batch size.
+
+        Args:
+            rows: List of dictionaries with product features
+
+        Returns:
+            List of dictionaries with predicted price and sales
+        """
+        if self.price_model is None or self.sales_model is None:
+            if not self.load_models():
+                raise ValueError("Models not trained or loaded properly")
+
+        if self._row_buf is None:
+            self._build_predict_cache()
+
+        X = np.empty((len(rows), len(self.feature_names)), dtype=np.float64)
+        for r, product_data in enumerate(rows):
+            self._fill_row(X, r, product_data)
+
+        if self._price_fast is not None:
+            price_preds = self._price_fast.predict(X)
+            sales_preds = self._sales_fast.predict(X)
+        else:
+            price_preds = self.price_model.predict(X)
+            sales_preds = self.sales_model.predict(X)
+
+        return [
+            {"predicted_price": float(p), "predicted_sales": float(s)}
+            for p, s in zip(price_preds, sales_preds)
+        ]
+
 def main():
     """
     Main entry point for the script
     """
-    # Function to log to both stderr and stdout
-    def log_info(msg):
-        sys.stderr.write(msg + "\n")
-        print(f"INFO: {msg}")
-    
     parser = argparse.ArgumentParser(description="LightGBM Model for Product Price and Sales Prediction")
-    parser.add_argument("action", choices=["train", "predict"], help="Action to perform: train or predict")
-    parser.add_argument("train_data", help="Path to training data CSV for training or JSON string for prediction")
+    parser.add_argument("action", choices=["train", "predict", "predict-batch"], help="Action to perform: train, predict or predict-batch (NDJSON from stdin)")
+    parser.add_argument("train_data", nargs="?", help="Path to training data CSV for training or JSON string for prediction")
     parser.add_argument("--val-data", help="Path to validation data CSV (required for training)")
     parser.add_argument("--model-dir", default="models", help="Directory for model files")
+    parser.add_argument("--verbose", action="store_true", help="Print INFO logs on the predict paths (always on for training)")
 
     args = parser.parse_args()
+
+    if args.action == "train" or args.verbose:
+        # Function to log to both stderr and stdout
+        def log_info(msg):
+            sys.stderr.write(msg + "\n")
+            print(f"INFO: {msg}")
+    else:
+        # Горячий путь предсказания: наружу уходит только итоговый JSON,
+        # INFO-вывод (десятки syscall'ов на вызов) включается флагом --verbose
+        def log_info(msg):
+            pass
+
     log_info(f"Запуск с параметрами: action={args.action}, data={args.train_data}, model_dir={args.model_dir}")
 
     predictor = LightGBMPredictor(model_dir=args.model_dir)
 
+    if args.action in ("train", "predict") and not args.train_data:
+        log_info("ОШИБКА: не переданы данные")
+        print(json.dumps({"error": "Missing data argument"}))
+        sys.exit(1)
+
     if args.action == "train":
         if not args.val_data:
             log_info("ОШИБКА: необходимо указать путь к валидационным данным с помощью --val-data")
@@ -350,6 +604,29 @@ def main():
             log_info(f"ОШИБКА при предсказании: {str(e)}")
             print(json.dumps({"error": str(e)}))
             sys.exit(1)
+    elif args.action == "predict-batch":
+        # Одна загрузка моделей и один batch-предикт на все запросы:
+        # NDJSON на входе, по одному JSON-ответу на строку на выходе
+        lines = [line.strip() for line in sys.stdin if line.strip()]
+        results = [None] * len(lines)
+        rows = []
+        row_indices = []
+        for i, line in enumerate(lines):
+            try:
+                rows.append(json.loads(line))
+                row_indices.append(i)
+            except json.JSONDecodeError:
+                results[i] = {"error": "Invalid JSON input for prediction"}
+        if rows:
+            try:
+                for i, prediction in zip(row_indices, predictor.predict_batch(rows)):
+                    results[i] = prediction
+            except Exception as e:
+                log_info(f"ОШИБКА при предсказании: {str(e)}")
+                for i in row_indices:
+                    results[i] = {"error": str(e)}
+        for result in results:
+            print(json.dumps(result))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file